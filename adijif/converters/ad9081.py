@@ -1,11 +1,124 @@
 """AD9081 high speed MxFE clocking model."""
+import json
+import os
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Union
-
-from ..solvers import GEKKO, CpoModel, CpoSolveResult  # type: ignore
-from .ad9081_util import _load_rx_config_modes, _load_tx_config_modes
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..solvers import GEKKO, CpoModel, CpoSolveResult, cplex_solver  # type: ignore
+from ..solvers import CpoIntVar, CpoModelSolution, GKVariable  # type: ignore
+from .ad9081_util import (
+    _INTEGER_HZ_TOL,
+    _load_rx_config_modes,
+    _load_tx_config_modes,
+    _pll_scan,
+)
 from .converter import converter
 
+_SOLVERS = frozenset(["gekko", "CPLEX", "brute"])
+
+# Solver domains shared across all model builds. These are lists since
+# _convert_input only builds variables from lists
+_M_VCO_DOMAIN = [5, 7, 8, 11]
+_N_VCO_DOMAIN = list(range(2, 51))
+_R_DOMAIN = [1, 2, 3, 4]
+_D_DOMAIN = [1, 2, 3, 4]
+_L_DOMAIN = [1, 2, 3, 4]
+_LMFC_DIVISOR_DOMAIN = list(range(1, 21))
+# SYSREF is LMFC / divisor^2. CPLEX searches over the squares directly which
+# keeps the SYSREF relation a single division instead of a product of variables
+_LMFC_DIVISOR_SQUARED_DOMAIN = [d * d for d in _LMFC_DIVISOR_DOMAIN]
+
+
+def _brute_sysref_divisor(mfc: Union[int, float]) -> int:
+    """Select largest LMFC divisor which keeps SYSREF in integer Hz.
+
+    Args:
+        mfc (int, float): Multiframe clock (LMFC)
+
+    Returns:
+        int: LMFC divisor, 1 if no larger divisor gives an integer Hz SYSREF
+    """
+    for div in reversed(_LMFC_DIVISOR_DOMAIN):
+        sysref = mfc / (div * div)
+        if abs(sysref - round(sysref)) <= _INTEGER_HZ_TOL:
+            return div
+    return _LMFC_DIVISOR_DOMAIN[0]
+
+
+def _default_solver() -> str:
+    """Select solver used when none is requested.
+
+    CPLEX is preferred since it is faster on the integer divider searches of
+    the AD9081 PLL. GEKKO is used when docplex is not installed.
+
+    Returns:
+        str: Solver name (gekko or CPLEX)
+    """
+    return "CPLEX" if cplex_solver else "gekko"
+
+
+# Solved divider values persisted across processes. Opt-in with AD9081_CACHE=1
+_SOLUTION_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "adijif", "ad9081_solutions.json"
+)
+
+
+def _solution_cache_enabled() -> bool:
+    """Check if persistent solution cache is enabled.
+
+    Returns:
+        bool: True when AD9081_CACHE=1 is set
+    """
+    return os.environ.get("AD9081_CACHE", "0") == "1"
+
+
+def _read_solution_cache() -> Dict:
+    """Read all cached solutions from file.
+
+    Returns:
+        Dict: Solved values by configuration key. Empty if file is missing or
+            unreadable
+    """
+    try:
+        with open(_SOLUTION_CACHE_FILE) as f:
+            db = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return db if isinstance(db, dict) else {}
+
+
+def _load_solution(key: Tuple) -> Dict:
+    """Read previously solved divider values from persistent cache.
+
+    Args:
+        key (Tuple): Configuration key from _solve_cache_key
+
+    Returns:
+        Dict: Solved values by config name. Empty if not found
+    """
+    if not _solution_cache_enabled():
+        return {}
+    return _read_solution_cache().get(repr(key), {})
+
+
+def _store_solution(key: Tuple, values: Dict) -> None:
+    """Write solved divider values to persistent cache.
+
+    Args:
+        key (Tuple): Configuration key from _solve_cache_key
+        values (Dict): Solved values by config name
+    """
+    if not _solution_cache_enabled():
+        return
+    db = _read_solution_cache()
+    db[repr(key)] = values
+    try:
+        os.makedirs(os.path.dirname(_SOLUTION_CACHE_FILE), exist_ok=True)
+        with open(_SOLUTION_CACHE_FILE, "w") as f:
+            json.dump(db, f)
+    except (OSError, TypeError):
+        pass
+
 
 class ad9081_core(converter, metaclass=ABCMeta):
     """AD9081 high speed MxFE model.
@@ -41,15 +154,16 @@ class ad9081_core(converter, metaclass=ABCMeta):
     name = "AD9081"
 
     # Integrated PLL constants
-    l_available = [1, 2, 3, 4]
+    l_available = _L_DOMAIN
+    _L_SET = frozenset(l_available)
     l = 1  # pylint:  disable=E741
-    m_vco_available = [5, 7, 8, 11]  # 8 is nominal
+    m_vco_available = _M_VCO_DOMAIN  # 8 is nominal
     m_vco = 8
-    n_vco_available = [*range(2, 50 + 1)]
+    n_vco_available = _N_VCO_DOMAIN
     n_vco = 2
-    r_available = [1, 2, 3, 4]
+    r_available = _R_DOMAIN
     r = 1
-    d_available = [1, 2, 3, 4]
+    d_available = _D_DOMAIN
     d = 1
     # Integrated PLL limits
     pfd_min = 25e6
@@ -77,15 +191,101 @@ class ad9081_core(converter, metaclass=ABCMeta):
     bit_clock_min_available = {"jesd204b": 1.5e9, "jesd204c": 6e9}
     bit_clock_max_available = {"jesd204b": 15.5e9, "jesd204c": 24.75e9}
 
-    config = {}  # type: ignore
-
     device_clock_max = 12e9
     _model_type = "adc"
 
+    # Attributes which change the converter clock or PLL fragment. Writing any
+    # of these drops previously built _pll_config fragments
+    _pll_cache_watch = frozenset(
+        [
+            "l",
+            "m_vco",
+            "n_vco",
+            "r",
+            "d",
+            "l_available",
+            "m_vco_available",
+            "n_vco_available",
+            "r_available",
+            "d_available",
+            "clocking_option",
+            "decimation",
+            "interpolation",
+            "sample_clock",
+            "vco_min",
+            "vco_max",
+            "pfd_min",
+            "pfd_max",
+        ]
+    )
+    # Solver decision variables persisted in the solution cache
+    _solution_vars = ["l", "m_vco", "n_vco", "r", "d", "lmfc_divisor_sysref_squared"]
+
+    _pll_cache_fields = [
+        "l",
+        "adc_clk",
+        "dac_clk",
+        "converter_clk",
+        "m_vco",
+        "n_vco",
+        "r",
+        "d",
+        "ref_clk",
+        "vco",
+        "pfd",
+    ]
+
+    # Frozen copies of *_available lists used for membership checks. Rebuilt
+    # when the list is reassigned
+    _available_sets = {
+        "l_available": "_L_SET",
+    }
+
+    def __init__(self) -> None:
+        """Initialize per instance model state.
+
+        Solver and model are set by the RX, TX and combined models.
+        """
+        self.config: Dict = {}
+        self._pll_cache: Dict = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute and invalidate cached PLL model fragments.
+
+        Unknown solvers are rejected when the solver is set.
+
+        Args:
+            name (str): Attribute name
+            value (Any): Attribute value
+
+        Raises:
+            Exception: If solver is not valid
+        """
+        if name in self._pll_cache_watch:
+            super().__setattr__("_pll_cache", {})
+        if name in self._available_sets:
+            super().__setattr__(self._available_sets[name], frozenset(value))
+        if name == "solver" and value not in _SOLVERS:
+            raise Exception(f"Unknown solver {value}")
+        super().__setattr__(name, value)
+
     def _check_valid_internal_configuration(self) -> None:
         # FIXME
         pass
 
+    def _seed_link_config(self, mode: str) -> None:
+        """Set only DualLink and JESD class from a quick configuration mode.
+
+        DualLink is not set by users but is compared when the JESD mode is
+        validated, so it must match the mode table.
+
+        Args:
+            mode (str): Quick configuration mode name
+        """
+        cfg = self.quick_configuration_modes[mode]
+        self.DualLink = cfg["DualLink"]
+        self.jesd_class = cfg["jesd_class"]
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
@@ -98,9 +298,107 @@ class ad9081_core(converter, metaclass=ABCMeta):
         Returns:
             Dict: Dictionary of clocking rates and dividers for configuration
         """
+        if self.solver == "brute":
+            return {**self.config, "clocking_option": self.clocking_option}
+
+        if solution:
+            self.solution = solution
+
+        self._cache_solution()
+
         # FIXME
         return {"clocking_option": self.clocking_option}
 
+    def _cache_solution(self) -> None:
+        """Store solved divider values when the solution cache is enabled.
+
+        Nothing is stored for CPLEX until a solution has been provided.
+        Variables which are not part of the solved model are skipped.
+        """
+        if not _solution_cache_enabled():
+            return
+        if self.solver == "CPLEX" and getattr(self, "solution", None) is None:
+            return
+        values = {}
+        for k in self._solution_vars:
+            if k not in self.config:
+                continue
+            try:
+                values[k] = self._get_val(self.config[k])
+            except KeyError:
+                continue
+        if values:
+            _store_solution(self._solve_cache_key(), values)
+
+    def _solve_cache_key(self) -> Tuple:
+        """Build key of all JESD and clocking settings for the solution cache.
+
+        Returns:
+            Tuple: Hashable key of current configuration
+        """
+        if self._model_type == "adc":
+            rate = self.decimation  # type: ignore
+        else:
+            rate = self.interpolation  # type: ignore
+        return (
+            self.name,
+            self._model_type,
+            self.M,
+            self.L,
+            self.N,
+            self.Np,
+            self.F,
+            self.S,
+            self.K,
+            self.CS,
+            self.CF,
+            self.sample_clock,
+            rate,
+            self.clocking_option,
+            self.solver,
+        )
+
+    def _warm_start(self) -> None:
+        """Seed solver variables with values of a previously solved configuration.
+
+        Values only set initial guesses/starting points so configurations
+        that are infeasible with the rest of the system are still searched.
+        """
+        if self.solver == "brute":
+            return
+        hint = _load_solution(self._solve_cache_key())
+        if not hint:
+            return
+        if self.solver == "CPLEX":
+            sp = self.model.get_starting_point() or CpoModelSolution()
+            for k, v in hint.items():
+                if isinstance(self.config.get(k), CpoIntVar):
+                    sp.add_integer_var_solution(self.config[k], v)
+            self.model.set_starting_point(sp)
+        elif self.solver == "gekko":
+            for k, v in hint.items():
+                if isinstance(self.config.get(k), GKVariable):
+                    self.config[k].value = v
+
+    # Clocking option and clock names last built for it
+    _clock_names_cache: Tuple[str, List[str]] = ("", [])
+
+    @property
+    def required_clock_names(self) -> List[str]:
+        """Names of requested clocks.
+
+        This list of names is for the clocks defined by get_required_clocks.
+        It is only rebuilt when the clocking option changes.
+
+        Returns:
+            List[str]: List of strings of clock names in order
+        """
+        option = self.clocking_option
+        if self._clock_names_cache[0] != option:
+            clk = "ad9081_dac_clock" if option == "direct" else "ad9081_pll_ref"
+            self._clock_names_cache = (option, [clk, "ad9081_sysref"])
+        return self._clock_names_cache[1]
+
     def get_required_clock_names(self) -> List[str]:
         """Get list of strings of names of requested clocks.
 
@@ -109,10 +407,7 @@ class ad9081_core(converter, metaclass=ABCMeta):
         Returns:
             List[str]: List of strings of clock names in order
         """
-        clk = (
-            "ad9081_dac_clock" if self.clocking_option == "direct" else "ad9081_pll_ref"
-        )
-        return [clk, "ad9081_sysref"]
+        return list(self.required_clock_names)
 
     @property
     @abstractmethod
@@ -124,16 +419,62 @@ class ad9081_core(converter, metaclass=ABCMeta):
         """
         raise NotImplementedError
 
-    def _pll_config(self, rxtx: bool = False) -> Dict:
+    def _maybe_intermediate(self, expr: Any) -> Any:
+        """Wrap expression as solver intermediate unless it is a constant.
+
+        Numeric constants need no extra solver variable or equation, which
+        also covers the brute solver where every value is a constant.
+
+        Args:
+            expr (Any): Solver expression or numeric constant
+
+        Returns:
+            Any: Intermediate or unchanged constant
+        """
+        if isinstance(expr, (int, float)):
+            return expr
+        return self._add_intermediate(expr)
+
+    def _pll_cache_key(self, rxtx: bool) -> Tuple:
+        """Build key of invariant inputs of the PLL model fragment.
+
+        Args:
+            rxtx (bool): Use TX converter clock limits for combined model
+
+        Returns:
+            Tuple: Hashable key for _pll_cache
+        """
+        clk = self.dac if rxtx else self  # type: ignore
+        return (
+            self.solver,
+            id(self.model),
+            clk.converter_clock_min,
+            clk.converter_clock_max,
+            self.vco_min,
+            self.vco_max,
+            self.pfd_min,
+            self.pfd_max,
+            rxtx,
+            self.clocking_option,
+        )
+
+    def _pll_config(self, rxtx: bool = False) -> Any:
+
+        # Reuse fragment already built within the current model
+        key = self._pll_cache_key(rxtx)
+        cached = self._pll_cache.get(key)
+        if cached and cached[0] is self.model:
+            self.config.update(cached[1])
+            return self.config["ref_clk"]
 
         self._converter_clock_config()  # type: ignore
 
-        self.config["m_vco"] = self._convert_input([5, 7, 8, 11], "m_vco")
-        self.config["n_vco"] = self._convert_input([*range(2, 51)], "n_vco")
-        self.config["r"] = self._convert_input([1, 2, 3, 4], "r")
-        self.config["d"] = self._convert_input([1, 2, 3, 4], "d")
+        self.config["m_vco"] = self._convert_input(self.m_vco_available, "m_vco")
+        self.config["n_vco"] = self._convert_input(self.n_vco_available, "n_vco")
+        self.config["r"] = self._convert_input(self.r_available, "r")
+        self.config["d"] = self._convert_input(self.d_available, "d")
 
-        self.config["ref_clk"] = self._add_intermediate(
+        self.config["ref_clk"] = self._maybe_intermediate(
             self.config["converter_clk"]
             * self.config["d"]
             * self.config["r"]
@@ -159,7 +500,7 @@ class ad9081_core(converter, metaclass=ABCMeta):
         # else:
         #     raise Exception("Unknown solver")
 
-        self.config["vco"] = self._add_intermediate(
+        self.config["vco"] = self._maybe_intermediate(
             self.config["ref_clk"]
             * self.config["m_vco"]
             * self.config["n_vco"]
@@ -183,12 +524,16 @@ class ad9081_core(converter, metaclass=ABCMeta):
         # else:
         #     raise Exception("Unknown solver: %s" % self.solver)
 
+        self.config["pfd"] = self._maybe_intermediate(
+            self.config["ref_clk"] / self.config["r"]
+        )
+
         self._add_equation(
             [
                 self.config["vco"] >= self.vco_min,
                 self.config["vco"] <= self.vco_max,
-                self.config["ref_clk"] / self.config["r"] <= self.pfd_max,
-                self.config["ref_clk"] / self.config["r"] >= self.pfd_min,
+                self.config["pfd"] >= self.pfd_min,
+                self.config["pfd"] <= self.pfd_max,
                 # self.config["converter_clk"] <= self.device_clock_max,
                 self.config["converter_clk"]
                 >= (
@@ -205,8 +550,123 @@ class ad9081_core(converter, metaclass=ABCMeta):
             ]
         )
 
+        fragment = {
+            k: self.config[k] for k in self._pll_cache_fields if k in self.config
+        }
+        self._pll_cache = {key: (self.model, fragment)}
+
+        return self.config["ref_clk"]
+
+    @abstractmethod
+    def _brute_converter_clock(self) -> Tuple[float, Optional[List[int]]]:
+        """Converter clock inputs for brute force PLL search.
+
+        Returns:
+            Tuple: Clock rate and available L dividers applied to it, or None
+                when the rate is the converter clock directly
+
+        Raises:
+            NotImplementedError: Method not implemented
+        """
+        raise NotImplementedError
+
+    def _brute_solve(self, rxtx: bool = False) -> float:
+        """Search integrated PLL settings by enumeration instead of a solver.
+
+        The divider space (m_vco x n_vco x r x d x l) is only a few thousand
+        combinations so every combination is evaluated directly. The valid
+        setting with the lowest reference clock is selected. The scan is
+        compiled with numba when installed.
+
+        Args:
+            rxtx (bool): Use TX converter clock limits for combined model
+
+        Returns:
+            float: Required reference clock
+
+        Raises:
+            Exception: No valid PLL configuration
+        """
+        clk = self.dac if rxtx else self  # type: ignore
+        rate, l_available = self._brute_converter_clock()
+        l_values = l_available if l_available else [1]
+
+        idx = _pll_scan(
+            rate,
+            l_values,
+            self.m_vco_available,
+            self.n_vco_available,
+            self.r_available,
+            self.d_available,
+            [
+                self.vco_min,
+                self.vco_max,
+                self.pfd_min,
+                self.pfd_max,
+                clk.converter_clock_min,
+                clk.converter_clock_max,
+            ],
+        )
+        if idx is None:
+            raise Exception("No valid PLL configuration found")
+        m_vco = self.m_vco_available[idx[0]]
+        n_vco = self.n_vco_available[idx[1]]
+        r = self.r_available[idx[2]]
+        d = self.d_available[idx[3]]
+        converter_clk = rate * l_values[idx[4]]
+
+        if l_available:
+            self.config["l"] = l_values[idx[4]]
+        self.config["converter_clk"] = converter_clk
+        self.config["m_vco"] = m_vco
+        self.config["n_vco"] = n_vco
+        self.config["r"] = r
+        self.config["d"] = d
+        self.config["ref_clk"] = converter_clk * d * r / (m_vco * n_vco)
+        self.config["vco"] = self.config["ref_clk"] * m_vco * n_vco / r
+        self.config["pfd"] = self.config["ref_clk"] / r
+
         return self.config["ref_clk"]
 
+    def _sysref_divisor(self, prefix: str = "") -> Any:
+        """Squared LMFC divisor used to derive SYSREF.
+
+        GEKKO turns the uneven squared domain into an SOS1 set with one
+        binary per value, so there the integer divisor is squared through an
+        intermediate instead. Without a solver the largest divisor giving an
+        integer Hz SYSREF is selected.
+
+        Args:
+            prefix (str): Prefix of variable name. Also selects the adc or dac
+                multiframe clock for the brute solver
+
+        Returns:
+            Any: Solver variable, intermediate or fixed divisor
+        """
+        if self.solver == "brute":
+            conv = getattr(self, prefix[:-1]) if prefix else self
+            return _brute_sysref_divisor(conv.multiframe_clock) ** 2
+        if self.solver == "gekko":
+            div = self._convert_input(
+                _LMFC_DIVISOR_DOMAIN, f"{prefix}lmfc_divisor_sysref"
+            )
+            return self._add_intermediate(div * div)
+        return self._convert_input(
+            _LMFC_DIVISOR_SQUARED_DOMAIN, f"{prefix}lmfc_divisor_sysref_squared"
+        )
+
+    def _build_sysref(self, mfc: Union[int, float], div_var: Any) -> Any:
+        """Build SYSREF rate from multiframe clock and squared LMFC divisor.
+
+        Args:
+            mfc (int, float): Multiframe clock (LMFC)
+            div_var (Any): Squared LMFC divisor from _sysref_divisor
+
+        Returns:
+            Any: SYSREF solver expression or constant
+        """
+        return self._maybe_intermediate(mfc / div_var)
+
     def get_required_clocks(self) -> List:
         """Generate list required clocks.
 
@@ -218,29 +678,22 @@ class ad9081_core(converter, metaclass=ABCMeta):
         Raises:
             Exception: If direct clocking is used. Not yet implemented
         """
+        mfc = self.multiframe_clock  # type: ignore
+
         # SYSREF
         self.config = {}
-        self.config["lmfc_divisor_sysref"] = self._convert_input(
-            [*range(1, 21)], "lmfc_divisor_sysref"
-        )
+        self.config["lmfc_divisor_sysref_squared"] = self._sysref_divisor()
 
-        if self.solver == "gekko":
-            self.config["sysref"] = self.model.Intermediate(
-                self.multiframe_clock  # type: ignore
-                / (
-                    self.config["lmfc_divisor_sysref"]
-                    * self.config["lmfc_divisor_sysref"]
-                )
-            )
-        elif self.solver == "CPLEX":
-            self.config["sysref"] = self.multiframe_clock / (
-                self.config["lmfc_divisor_sysref"] * self.config["lmfc_divisor_sysref"]
-            )
+        self.config["sysref"] = self._build_sysref(
+            mfc, self.config["lmfc_divisor_sysref_squared"]
+        )
 
         # Device Clocking
         if self.clocking_option == "direct":
             raise Exception("Not implemented yet")
             # adc_clk = self.sample_clock * self.datapath_decimation
+        elif self.solver == "brute":
+            clk = self._brute_solve()
         else:
             clk = self._pll_config()  # type: ignore
 
@@ -248,6 +701,8 @@ class ad9081_core(converter, metaclass=ABCMeta):
         # self.model.Obj(self.config["sysref"])  # This breaks many searches
         # self.model.Obj(-1*self.config["lmfc_divisor_sysref"])
 
+        self._warm_start()
+
         return [clk, self.config["sysref"]]
 
 
@@ -262,7 +717,16 @@ class ad9081_rx(ad9081_core):
     sample_clock_min = 312.5e6 / 16
     sample_clock_max = 4e9
 
-    quick_configuration_modes = _load_rx_config_modes()
+    @property
+    def quick_configuration_modes(self) -> Dict:
+        """Get RX JESD configuration modes.
+
+        The table is parsed on first use and shared by all instances.
+
+        Returns:
+            Dict: JESD configuration modes by mode name
+        """
+        return _load_rx_config_modes()
 
     decimation_available = [
         1,
@@ -287,7 +751,10 @@ class ad9081_rx(ad9081_core):
     decimation = 1
 
     def __init__(
-        self, model: Union[GEKKO, CpoModel] = None, solver: str = None
+        self,
+        model: Union[GEKKO, CpoModel] = None,
+        solver: str = None,
+        _skip_default_mode: bool = False,
     ) -> None:
         """Initialize AD9081 clocking model for RX.
 
@@ -296,35 +763,41 @@ class ad9081_rx(ad9081_core):
 
         Args:
             model (GEKKO,CpoModel): Solver model
-            solver (str): Solver name (gekko or CPLEX)
+            solver (str): Solver name (gekko, CPLEX or brute). Defaults to
+                CPLEX when installed, otherwise gekko
+            _skip_default_mode (bool): Only take DualLink and JESD class from
+                mode "0". Used when the owner sets the JESD configuration
         """
-        if solver:
-            self.solver = solver
+        super().__init__()
+        self.solver = solver if solver else _default_solver()
         if model:
             self.model = model
-        self.set_quick_configuration_mode("0")
+        if _skip_default_mode:
+            self._seed_link_config("0")
+        else:
+            self.set_quick_configuration_mode("0")
+
+    def _brute_converter_clock(self) -> Tuple[float, Optional[List[int]]]:
+        """Converter clock inputs for brute force PLL search.
+
+        Returns:
+            Tuple: ADC clock and available L dividers
+        """
+        return self.decimation * self.sample_clock, self.l_available
 
     def _converter_clock_config(self) -> None:
         """RX specific configuration of internall PLL config.
 
         This method will update the config struct to include
         the RX clocking constraints
-
-        Raises:
-            Exception: If solver is not valid
         """
         adc_clk = self.decimation * self.sample_clock
-        self.config["l"] = self._convert_input([1, 2, 3, 4], "l")
+        self.config["l"] = self._convert_input(self.l_available, "l")
         self.config["adc_clk"] = self._convert_input(adc_clk)
 
-        if self.solver == "gekko":
-            self.config["converter_clk"] = self.model.Intermediate(
-                self.config["adc_clk"] * self.config["l"]
-            )
-        elif self.solver == "CPLEX":
-            self.config["converter_clk"] = self.config["adc_clk"] * self.config["l"]
-        else:
-            raise Exception(f"Unknown solver {self.solver}")
+        self.config["converter_clk"] = self._maybe_intermediate(
+            self.config["adc_clk"] * self.config["l"]
+        )
 
 
 class ad9081_tx(ad9081_core):
@@ -338,7 +811,16 @@ class ad9081_tx(ad9081_core):
     sample_clock_min = 2.9e9 / (6 * 24)  # with max interpolation
     sample_clock_max = 12e9
 
-    quick_configuration_modes = _load_tx_config_modes()
+    @property
+    def quick_configuration_modes(self) -> Dict:
+        """Get TX JESD configuration modes.
+
+        The table is parsed on first use and shared by all instances.
+
+        Returns:
+            Dict: JESD configuration modes by mode name
+        """
+        return _load_tx_config_modes()
 
     interpolation_available = [
         1,
@@ -363,7 +845,10 @@ class ad9081_tx(ad9081_core):
     interpolation = 1
 
     def __init__(
-        self, model: Union[GEKKO, CpoModel] = None, solver: str = None
+        self,
+        model: Union[GEKKO, CpoModel] = None,
+        solver: str = None,
+        _skip_default_mode: bool = False,
     ) -> None:
         """Initialize AD9081 clocking model for TX.
 
@@ -372,33 +857,37 @@ class ad9081_tx(ad9081_core):
 
         Args:
             model (GEKKO,CpoModel): Solver model
-            solver (str): Solver name (gekko or CPLEX)
+            solver (str): Solver name (gekko, CPLEX or brute). Defaults to
+                CPLEX when installed, otherwise gekko
+            _skip_default_mode (bool): Only take DualLink and JESD class from
+                mode "0". Used when the owner sets the JESD configuration
         """
-        if solver:
-            self.solver = solver
+        super().__init__()
+        self.solver = solver if solver else _default_solver()
         if model:
             self.model = model
-        self.set_quick_configuration_mode("0")
+        if _skip_default_mode:
+            self._seed_link_config("0")
+        else:
+            self.set_quick_configuration_mode("0")
+
+    def _brute_converter_clock(self) -> Tuple[float, Optional[List[int]]]:
+        """Converter clock inputs for brute force PLL search.
+
+        Returns:
+            Tuple: DAC clock used directly as converter clock
+        """
+        return self.interpolation * self.sample_clock, None
 
     def _converter_clock_config(self) -> None:
         """TX specific configuration of internall PLL config.
 
         This method will update the config struct to include
         the TX clocking constraints
-
-        Raises:
-            Exception: If solver is not valid
         """
         dac_clk = self.interpolation * self.sample_clock
         self.config["dac_clk"] = self._convert_input(dac_clk)
-        if self.solver == "gekko":
-            self.config["converter_clk"] = self.model.Intermediate(
-                self.config["dac_clk"]
-            )
-        elif self.solver == "CPLEX":
-            self.config["converter_clk"] = self.config["dac_clk"]
-        else:
-            raise Exception(f"Unknown solver {self.solver}")
+        self.config["converter_clk"] = self.config["dac_clk"]
 
 
 class ad9081(ad9081_core):
@@ -418,12 +907,13 @@ class ad9081(ad9081_core):
 
         Args:
             model (GEKKO,CpoModel): Solver model
-            solver (str): Solver name (gekko or CPLEX)
+            solver (str): Solver name (gekko, CPLEX or brute). Defaults to
+                CPLEX when installed, otherwise gekko
         """
-        if solver:
-            self.solver = solver
-        self.adc = ad9081_rx(model, solver=self.solver)
-        self.dac = ad9081_tx(model, solver=self.solver)
+        super().__init__()
+        self.solver = solver if solver else _default_solver()
+        self.adc = ad9081_rx(model, solver=self.solver, _skip_default_mode=True)
+        self.dac = ad9081_tx(model, solver=self.solver, _skip_default_mode=True)
         self.model = model
 
     def validate_config(self) -> None:
@@ -438,41 +928,94 @@ class ad9081(ad9081_core):
     def _get_converters(self) -> List[Union[converter, converter]]:
         return [self.adc, self.dac]
 
-    def get_required_clock_names(self) -> List[str]:
-        """Get list of strings of names of requested clocks.
+    @property
+    def required_clock_names(self) -> List[str]:
+        """Names of requested clocks.
 
-        This list of names is for the clocks defined by get_required_clocks
+        This list of names is for the clocks defined by get_required_clocks.
+        It is only rebuilt when the ADC clocking option changes.
 
         Returns:
             List[str]: List of strings of clock names in order
         """
-        clk = (
-            "ad9081_dac_clock"
-            if self.adc.clocking_option == "direct"
-            else "ad9081_pll_ref"
+        option = self.adc.clocking_option
+        if self._clock_names_cache[0] != option:
+            clk = "ad9081_dac_clock" if option == "direct" else "ad9081_pll_ref"
+            self._clock_names_cache = (
+                option,
+                [clk, "ad9081_adc_sysref", "ad9081_dac_sysref"],
+            )
+        return self._clock_names_cache[1]
+
+    # Only the ADC SYSREF is constrained by system.solve so the DAC divisor
+    # is not part of the solution
+    _solution_vars = ["m_vco", "n_vco", "r", "d", "adc_lmfc_divisor_sysref_squared"]
+
+    def _solve_cache_key(self) -> Tuple:
+        """Build key of all JESD and clocking settings for the solution cache.
+
+        Returns:
+            Tuple: Hashable key of current configuration
+        """
+        return (
+            self.adc._solve_cache_key(),
+            self.dac._solve_cache_key(),
+            self.clocking_option,
+            self.solver,
         )
-        return [clk, "ad9081_adc_sysref", "ad9081_dac_sysref"]
 
-    def _converter_clock_config(self) -> None:
+    def _pll_cache_key(self, rxtx: bool) -> Tuple:
+        """Build key of invariant inputs of the PLL model fragment.
+
+        Child converter rates are included since writes to them are not
+        seen by this object
+
+        Args:
+            rxtx (bool): Use TX converter clock limits for combined model
+
+        Returns:
+            Tuple: Hashable key for _pll_cache
+        """
+        return super()._pll_cache_key(rxtx) + (
+            self.adc.decimation * self.adc.sample_clock,
+            self.dac.interpolation * self.dac.sample_clock,
+        )
+
+    def _converter_rates(self) -> Tuple[float, float]:
+        """Get ADC and DAC clocks and check they share the converter clock.
+
+        Returns:
+            Tuple: ADC and DAC clock rates
+
+        Raises:
+            Exception: ADC clock is not DAC clock/L
+        """
         adc_clk = self.adc.decimation * self.adc.sample_clock
         dac_clk = self.dac.interpolation * self.dac.sample_clock
-        l = dac_clk / adc_clk
-        if l not in self.adc.l_available:
+        # Float rates like 4e9 / 3 are not exact so allow 1 Hz of error
+        l = round(dac_clk / adc_clk)
+        if abs(dac_clk - l * adc_clk) > 1 or l not in self.adc._L_SET:
             raise Exception(
                 f"ADC clock must be DAC clock/L where L={self.adc.l_available}."
-                + f" Got {l}"
+                + f" Got {dac_clk / adc_clk}"
             )
+        return adc_clk, dac_clk
+
+    def _brute_converter_clock(self) -> Tuple[float, Optional[List[int]]]:
+        """Converter clock inputs for brute force PLL search.
+
+        Returns:
+            Tuple: DAC clock used directly as converter clock
+        """
+        _, dac_clk = self._converter_rates()
+        return dac_clk, None
+
+    def _converter_clock_config(self) -> None:
+        adc_clk, dac_clk = self._converter_rates()
 
         self.config["dac_clk"] = self._convert_input(dac_clk)
         self.config["adc_clk"] = self._convert_input(adc_clk)
-        if self.solver == "gekko":
-            self.config["converter_clk"] = self.model.Intermediate(
-                self.config["dac_clk"]
-            )
-        elif self.solver == "CPLEX":
-            self.config["converter_clk"] = self.config["dac_clk"]
-        else:
-            raise Exception(f"Unknown solver {self.solver}")
+        self.config["converter_clk"] = self.config["dac_clk"]
 
     def get_required_clocks(self) -> List:
         """Generate list required clocks.
@@ -485,46 +1028,27 @@ class ad9081(ad9081_core):
         Raises:
             Exception: If direct clocking is used. Not yet implemented
         """
+        adc_mfc = self.adc.multiframe_clock
+        dac_mfc = self.dac.multiframe_clock
+
         # SYSREF
         self.config = {}
-        self.config["adc_lmfc_divisor_sysref"] = self._convert_input(
-            [*range(1, 21)], "adc_lmfc_divisor_sysref"
+        self.config["adc_lmfc_divisor_sysref_squared"] = self._sysref_divisor("adc_")
+        self.config["dac_lmfc_divisor_sysref_squared"] = self._sysref_divisor("dac_")
+
+        self.config["sysref_adc"] = self._build_sysref(
+            adc_mfc, self.config["adc_lmfc_divisor_sysref_squared"]
         )
-        self.config["dac_lmfc_divisor_sysref"] = self._convert_input(
-            [*range(1, 21)], "dac_lmfc_divisor_sysref"
+        self.config["sysref_dac"] = self._build_sysref(
+            dac_mfc, self.config["dac_lmfc_divisor_sysref_squared"]
         )
 
-        if self.solver == "gekko":
-            self.config["sysref_adc"] = self.model.Intermediate(
-                self.adc.multiframe_clock
-                / (
-                    self.config["adc_lmfc_divisor_sysref"]
-                    * self.config["adc_lmfc_divisor_sysref"]
-                )
-            )
-            self.config["sysref_dac"] = self.model.Intermediate(
-                self.dac.multiframe_clock
-                / (
-                    self.config["dac_lmfc_divisor_sysref"]
-                    * self.config["dac_lmfc_divisor_sysref"]
-                )
-            )
-        elif self.solver == "CPLEX":
-            self.config["sysref_adc"] = self.adc.multiframe_clock / (
-                self.config["adc_lmfc_divisor_sysref"]
-                * self.config["adc_lmfc_divisor_sysref"]
-            )
-            self.config["sysref_dac"] = self.dac.multiframe_clock / (
-                self.config["dac_lmfc_divisor_sysref"]
-                * self.config["dac_lmfc_divisor_sysref"]
-            )
-        else:
-            raise Exception(f"Unknown solver {self.solver}")
-
         # Device Clocking
         if self.clocking_option == "direct":
             raise Exception("Not implemented yet")
             # adc_clk = self.sample_clock * self.datapath_decimation
+        elif self.solver == "brute":
+            clk = self._brute_solve(rxtx=True)
         else:
             clk = self._pll_config(rxtx=True)
 
@@ -532,4 +1056,6 @@ class ad9081(ad9081_core):
         # self.model.Obj(self.config["sysref"])  # This breaks many searches
         # self.model.Obj(-1*self.config["lmfc_divisor_sysref"])
 
+        self._warm_start()
+
         return [clk, self.config["sysref_adc"], self.config["sysref_dac"]]
@@ -1,7 +1,13 @@
 """AD9081 MxFE Utility Functions."""
 import csv
 import os
-from typing import Dict, Union
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Reference clocks within this many Hz of an integer count as integer Hz
+_INTEGER_HZ_TOL = 1e-3
 
 
 def _convert_to_config(
@@ -29,16 +35,215 @@ def _convert_to_config(
     }
 
 
+@lru_cache(maxsize=1)
 def _load_rx_config_modes() -> Dict:
-    """Load RX JESD configuration tables from file."""
+    """Load RX JESD configuration tables from file.
+
+    The table is parsed once per process and shared. Callers must treat it as
+    read-only.
+
+    Returns:
+        Dict: JESD configuration modes by mode name
+    """
     return _read_table("full_rx_mode_table_ad9081.csv")
 
 
+@lru_cache(maxsize=1)
 def _load_tx_config_modes() -> Dict:
-    """Load TX JESD configuration tables from file."""
+    """Load TX JESD configuration tables from file.
+
+    The table is parsed once per process and shared. Callers must treat it as
+    read-only.
+
+    Returns:
+        Dict: JESD configuration modes by mode name
+    """
     return _read_table("full_tx_mode_table_ad9081.csv")
 
 
+def _pll_scan_numpy(
+    rate: float,
+    l_arr: np.ndarray,
+    m_arr: np.ndarray,
+    n_arr: np.ndarray,
+    r_arr: np.ndarray,
+    d_arr: np.ndarray,
+    limits: np.ndarray,
+) -> Optional[Tuple[int, ...]]:
+    """Find PLL setting with lowest integer Hz reference clock using arrays.
+
+    Falls back to the lowest fractional reference clock when no integer Hz
+    setting is valid.
+
+    Args:
+        rate (float): Clock multiplied by L to get converter clock
+        l_arr (np.ndarray): Available L dividers
+        m_arr (np.ndarray): Available m_vco dividers
+        n_arr (np.ndarray): Available n_vco dividers
+        r_arr (np.ndarray): Available r dividers
+        d_arr (np.ndarray): Available d dividers
+        limits (np.ndarray): vco, pfd and converter clock min/max limits
+
+    Returns:
+        Tuple: Indexes of selected m, n, r, d, l or None if no setting valid
+    """
+    vco_min, vco_max, pfd_min, pfd_max, clk_min, clk_max = limits
+    M, N, R, D, L = np.meshgrid(m_arr, n_arr, r_arr, d_arr, l_arr, indexing="ij")
+    converter_clk = rate * L
+    ref_clk = converter_clk * D * R / (M * N)
+    vco = ref_clk * M * N / R
+    pfd = ref_clk / R
+    valid = (
+        (vco >= vco_min)
+        & (vco <= vco_max)
+        & (pfd >= pfd_min)
+        & (pfd <= pfd_max)
+        & (converter_clk >= clk_min)
+        & (converter_clk <= clk_max)
+    )
+    if not valid.any():
+        return None
+    integer = valid & (np.abs(ref_clk - np.rint(ref_clk)) <= _INTEGER_HZ_TOL)
+    if integer.any():
+        valid = integer
+    i = np.argmin(np.where(valid, ref_clk, np.inf))
+    return tuple(int(x) for x in np.unravel_index(i, valid.shape))
+
+
+def _pll_scan_loops(
+    rate: float,
+    l_arr: np.ndarray,
+    m_arr: np.ndarray,
+    n_arr: np.ndarray,
+    r_arr: np.ndarray,
+    d_arr: np.ndarray,
+    limits: np.ndarray,
+) -> np.ndarray:
+    """Fused loop version of _pll_scan_numpy without temporary arrays.
+
+    Only used compiled, see _load_pll_scan_jit.
+
+    Args:
+        rate (float): Clock multiplied by L to get converter clock
+        l_arr (np.ndarray): Available L dividers
+        m_arr (np.ndarray): Available m_vco dividers
+        n_arr (np.ndarray): Available n_vco dividers
+        r_arr (np.ndarray): Available r dividers
+        d_arr (np.ndarray): Available d dividers
+        limits (np.ndarray): vco, pfd and converter clock min/max limits
+
+    Returns:
+        np.ndarray: Indexes of selected m, n, r, d, l. First index is -1
+            if no setting is valid
+    """
+    vco_min = limits[0]
+    vco_max = limits[1]
+    pfd_min = limits[2]
+    pfd_max = limits[3]
+    clk_min = limits[4]
+    clk_max = limits[5]
+    best = np.inf
+    best_frac = np.inf
+    idx = np.full(5, -1, dtype=np.int64)
+    idx_frac = np.full(5, -1, dtype=np.int64)
+    for a in range(len(m_arr)):
+        for b in range(len(n_arr)):
+            for c in range(len(r_arr)):
+                for d in range(len(d_arr)):
+                    for e in range(len(l_arr)):
+                        converter_clk = rate * l_arr[e]
+                        if converter_clk < clk_min or converter_clk > clk_max:
+                            continue
+                        ref_clk = (
+                            converter_clk * d_arr[d] * r_arr[c] / (m_arr[a] * n_arr[b])
+                        )
+                        vco = ref_clk * m_arr[a] * n_arr[b] / r_arr[c]
+                        pfd = ref_clk / r_arr[c]
+                        if (
+                            vco < vco_min
+                            or vco > vco_max
+                            or pfd < pfd_min
+                            or pfd > pfd_max
+                        ):
+                            continue
+                        if abs(ref_clk - round(ref_clk)) <= _INTEGER_HZ_TOL:
+                            if ref_clk < best:
+                                best = ref_clk
+                                idx[0] = a
+                                idx[1] = b
+                                idx[2] = c
+                                idx[3] = d
+                                idx[4] = e
+                        elif ref_clk < best_frac:
+                            best_frac = ref_clk
+                            idx_frac[0] = a
+                            idx_frac[1] = b
+                            idx_frac[2] = c
+                            idx_frac[3] = d
+                            idx_frac[4] = e
+    if idx[0] < 0:
+        return idx_frac
+    return idx
+
+
+@lru_cache(maxsize=1)
+def _load_pll_scan_jit() -> Optional[Callable]:
+    """Compile _pll_scan_loops with numba on first use.
+
+    numba is imported here instead of at module import since importing it
+    takes longer than importing the rest of the package.
+
+    Returns:
+        Callable: Compiled scan or None if numba is not installed
+    """
+    try:
+        from numba import njit  # type: ignore
+    except ImportError:
+        return None
+    return njit(cache=True)(_pll_scan_loops)
+
+
+def _pll_scan(
+    rate: float,
+    l_available: List[int],
+    m_available: List[int],
+    n_available: List[int],
+    r_available: List[int],
+    d_available: List[int],
+    limits: List[float],
+) -> Optional[Tuple[int, ...]]:
+    """Find integrated PLL setting with lowest integer Hz reference clock.
+
+    Uses a numba compiled kernel when numba is installed, otherwise NumPy.
+    Both select the same setting.
+
+    Args:
+        rate (float): Clock multiplied by L to get converter clock
+        l_available (List[int]): Available L dividers
+        m_available (List[int]): Available m_vco dividers
+        n_available (List[int]): Available n_vco dividers
+        r_available (List[int]): Available r dividers
+        d_available (List[int]): Available d dividers
+        limits (List[float]): vco min/max, pfd min/max and converter
+            clock min/max
+
+    Returns:
+        Tuple: Indexes of selected m, n, r, d, l or None if no setting valid
+    """
+    args = [
+        np.asarray(x, dtype=np.int64)
+        for x in [l_available, m_available, n_available, r_available, d_available]
+    ]
+    args.append(np.asarray(limits, dtype=np.float64))
+    scan = _load_pll_scan_jit()
+    if scan is None:
+        return _pll_scan_numpy(float(rate), *args)
+    idx = scan(float(rate), *args)
+    if idx[0] < 0:
+        return None
+    return tuple(int(x) for x in idx)
+
+
 def _read_table(fn: str) -> Dict:
     loc = os.path.dirname(__file__)
     fn = os.path.join(loc, "resources", fn)
@@ -10,16 +10,21 @@ try:
     from docplex.cp.model import (CpoModel, integer_var,  # type: ignore
                                   interval_var)
     from docplex.cp.solution import CpoSolveResult  # type: ignore
+    from docplex.cp.solution import CpoModelSolution  # type: ignore
 
     cplex_solver = True
 except ImportError:
     cplex_solver = False
     CpoExpr = None
     CpoFunctionCall = None
+    CpoIntVar = None
+    CpoModel = None
+    CpoSolveResult = None
     binary_var = None
     integer_var = None
     continuous_var = None
     interval_var = None
+    CpoModelSolution = None
 
 try:
     import gekko  # type: ignore
@@ -1,4 +1,5 @@
 import adijif
+import numpy as np
 import pprint
 
 vcxo = 125000000
@@ -8,7 +9,7 @@ clk = adijif.hmc7044()
 clk.n2 = 24
 
 output_clocks = [1e9, 500e6, 7.8125e6]
-output_clocks = list(map(int, output_clocks))  # force to be ints
+output_clocks = np.asarray(output_clocks, dtype=np.int64).tolist()  # force to be ints
 clock_names = ["ADC", "FPGA", "SYSREF"]
 
 clk.set_requested_clocks(vcxo, output_clocks, clock_names)
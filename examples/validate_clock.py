@@ -1,4 +1,5 @@
 import adijif
+import numpy as np
 
 vcxo = 125000000
 # vcxo = adijif.types.range(100000000, 126000000, 1000000, "vcxo")
@@ -14,7 +15,7 @@ clk.n2 = n2
 clk.use_vcxo_double = False
 
 output_clocks = [1e9, 500e6, 7.8125e6]
-output_clocks = list(map(int, output_clocks))
+output_clocks = np.asarray(output_clocks, dtype=np.int64).tolist()
 clock_names = ["ADC", "FPGA", "SYSREF"]
 
 clk.set_requested_clocks(vcxo, output_clocks, clock_names)
@@ -1,5 +1,9 @@
 # flake8: noqa
+import json
+import os
 import pprint
+import subprocess
+import sys
 
 import pytest
 
@@ -62,6 +66,218 @@ def test_ad9081_tx_solver():
     assert cfg["fpga_AD9081"]["type"] == "qpll"
 
 
+def test_ad9081_rxtx_invalid_l():
+    conv = adijif.ad9081(solver="CPLEX")
+
+    conv.adc.sample_clock = 250e6
+    conv.adc.decimation = 16
+    conv.dac.sample_clock = 250e6
+    conv.dac.interpolation = 36
+
+    with pytest.raises(Exception, match="ADC clock must be DAC clock/L"):
+        conv._converter_clock_config()
+
+
+@pytest.mark.parametrize(
+    "adc_rate, decimation, dac_rate, interpolation, l",
+    [
+        (4.7e9 / 3, 1, 4.7e9 / 9, 6, 2),  # DAC/ADC == 1.9999999999999998
+        (4e9 / 3, 1, 4e9, 1, 3),  # ADC clock is fractional Hz
+    ],
+)
+def test_ad9081_rxtx_float_l(adc_rate, decimation, dac_rate, interpolation, l):
+    conv = adijif.ad9081(solver="CPLEX")
+
+    conv.adc.sample_clock = adc_rate
+    conv.adc.decimation = decimation
+    conv.dac.sample_clock = dac_rate
+    conv.dac.interpolation = interpolation
+
+    adc_clk, dac_clk = conv._converter_rates()
+    assert dac_clk == pytest.approx(adc_clk * l)
+
+
+def test_ad9081_rxtx_default_link_config():
+    from adijif.converters import ad9081_util
+
+    conv = adijif.ad9081(solver="CPLEX")
+
+    for child, modes in [
+        (conv.adc, ad9081_util._load_rx_config_modes()),
+        (conv.dac, ad9081_util._load_tx_config_modes()),
+    ]:
+        assert child.DualLink == modes["0"]["DualLink"]
+        assert child.jesd_class == modes["0"]["jesd_class"]
+
+
+def test_ad9081_rxtx_duallink_rx_mode():
+    conv = adijif.ad9081(solver="CPLEX")
+
+    # L2/M8/F16/Np16 204C RX mode only exists as DualLink
+    conv.adc.sample_clock = 250e6
+    conv.adc.jesd_class = "jesd204c"
+    conv.adc.L = 2
+    conv.adc.M = 8
+    conv.adc.N = 16
+    conv.adc.Np = 16
+    conv.adc.F = 16
+    conv.adc.HD = 0
+    conv.adc.CS = 0
+
+    conv.adc._check_valid_jesd_mode()
+
+
+def test_ad9081_mode_tables_not_loaded_on_import():
+    code = (
+        "import adijif\n"
+        "from adijif.converters import ad9081_util\n"
+        "assert ad9081_util._load_rx_config_modes.cache_info().misses == 0\n"
+        "assert ad9081_util._load_tx_config_modes.cache_info().misses == 0\n"
+    )
+    # Fresh interpreter since other tests may already have loaded the tables
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_ad9081_pll_config_cache_hit():
+    from adijif.solvers import CpoModel
+
+    conv = adijif.ad9081_rx(CpoModel(), solver="CPLEX")
+    conv.sample_clock = 250e6
+    conv.decimation = 16
+
+    ref_clk = conv._pll_config()
+    assert conv._pll_config() is ref_clk
+
+
+@pytest.mark.parametrize("attr, value", [("sample_clock", 125e6), ("pfd_max", 500e6)])
+def test_ad9081_pll_config_cache_invalidate(attr, value):
+    from adijif.solvers import CpoModel
+
+    conv = adijif.ad9081_rx(CpoModel(), solver="CPLEX")
+    conv.sample_clock = 250e6
+    conv.decimation = 16
+
+    ref_clk = conv._pll_config()
+    setattr(conv, attr, value)
+
+    assert conv._pll_cache == {}
+    assert conv._pll_config() is not ref_clk
+
+
+def test_ad9081_sysref_squared_domain():
+    from adijif.solvers import CpoModel
+
+    conv = adijif.ad9081_rx(CpoModel(), solver="CPLEX")
+    conv.sample_clock = 250e6
+    conv.decimation = 16
+    mfc = conv.multiframe_clock
+
+    div = conv._sysref_divisor()
+    reachable = {mfc / d for d in div.get_domain()}
+
+    assert reachable == {mfc / (k * k) for k in range(1, 21)}
+
+
+def test_ad9081_required_clock_names_follow_clocking_option():
+    conv = adijif.ad9081_rx()
+    assert conv.required_clock_names == ["ad9081_pll_ref", "ad9081_sysref"]
+    conv.clocking_option = "direct"
+    assert conv.required_clock_names == ["ad9081_dac_clock", "ad9081_sysref"]
+    conv.clocking_option = "integrated_pll"
+    assert conv.required_clock_names == ["ad9081_pll_ref", "ad9081_sysref"]
+
+    conv = adijif.ad9081()
+    names = ["ad9081_adc_sysref", "ad9081_dac_sysref"]
+    assert conv.required_clock_names == ["ad9081_pll_ref"] + names
+    conv.adc.clocking_option = "direct"
+    assert conv.required_clock_names == ["ad9081_dac_clock"] + names
+    conv.adc.clocking_option = "integrated_pll"
+    assert conv.required_clock_names == ["ad9081_pll_ref"] + names
+
+
+def test_ad9081_rx_brute():
+    conv = adijif.ad9081_rx(solver="brute")
+    conv.sample_clock = 250e6
+    conv.decimation = 16
+
+    ref_clk, sysref = conv.get_required_clocks()
+    cfg = conv.get_config()
+
+    assert cfg["ref_clk"] == ref_clk
+    assert sysref == conv.multiframe_clock / cfg["lmfc_divisor_sysref_squared"]
+    assert sysref == int(sysref)
+    assert cfg["converter_clk"] == 4e9 * cfg["l"]
+    assert conv.vco_min <= cfg["vco"] <= conv.vco_max
+    assert conv.pfd_min <= cfg["pfd"] <= conv.pfd_max
+    assert cfg["vco"] == pytest.approx(cfg["converter_clk"] * cfg["d"])
+
+
+def test_ad9081_tx_brute_integer_ref_clk():
+    conv = adijif.ad9081_tx(solver="brute")
+    conv.sample_clock = 250e6
+    conv.interpolation = 48
+
+    ref_clk, _ = conv.get_required_clocks()
+
+    assert ref_clk == int(ref_clk)
+
+
+def test_ad9081_numba_not_imported_on_import():
+    code = "import sys\nimport adijif\nassert 'numba' not in sys.modules\n"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "rate, l_available",
+    [
+        (4e9, [1, 2, 3, 4]),
+        (1e9, [1, 2, 3, 4]),
+        (250e6 * 9, [1, 2, 3, 4]),
+        (6e9, [1]),
+        (12e9, [1]),
+        (4e9 / 7, [1, 2, 3, 4]),  # Only fractional reference clocks
+        (1e6, [1, 2, 3, 4]),  # No valid setting
+    ],
+)
+def test_ad9081_pll_scan_jit(rate, l_available):
+    pytest.importorskip("numba")
+    import numpy as np
+
+    from adijif.converters import ad9081_util
+
+    conv = adijif.ad9081_rx(solver="brute")
+    clk = adijif.ad9081_tx if l_available == [1] else adijif.ad9081_rx
+    args = [
+        np.asarray(x, dtype=np.int64)
+        for x in [
+            l_available,
+            conv.m_vco_available,
+            conv.n_vco_available,
+            conv.r_available,
+            conv.d_available,
+        ]
+    ]
+    limits = np.asarray(
+        [
+            conv.vco_min,
+            conv.vco_max,
+            conv.pfd_min,
+            conv.pfd_max,
+            clk.converter_clock_min,
+            clk.converter_clock_max,
+        ],
+        dtype=np.float64,
+    )
+
+    ref = ad9081_util._pll_scan_numpy(rate, *args, limits)
+    idx = ad9081_util._load_pll_scan_jit()(rate, *args, limits)
+
+    if ref is None:
+        assert idx[0] == -1
+    else:
+        assert tuple(int(x) for x in idx) == ref
+
+
 def test_ad9081_rxtx_solver():
     vcxo = 100000000
 
@@ -115,3 +331,84 @@ def test_ad9081_rxtx_solver():
 
     assert o["fpga_AD9081"][0]["type"] == "qpll"
     assert o["fpga_AD9081"][1]["type"] == "qpll"
+
+
+@pytest.fixture
+def solution_cache(tmp_path, monkeypatch):
+    from adijif.converters import ad9081
+
+    cache_file = str(tmp_path / "ad9081_solutions.json")
+    monkeypatch.setattr(ad9081, "_SOLUTION_CACHE_FILE", cache_file)
+    monkeypatch.setenv("AD9081_CACHE", "1")
+    return ad9081
+
+
+def test_ad9081_solution_cache_hit(solution_cache):
+    key = ("AD9081", "adc", 8, 4)
+    solution_cache._store_solution(key, {"m_vco": 8, "n_vco": 12})
+
+    assert solution_cache._load_solution(key) == {"m_vco": 8, "n_vco": 12}
+
+
+def test_ad9081_solution_cache_miss(solution_cache):
+    solution_cache._store_solution(("AD9081", "adc", 8, 4), {"m_vco": 8})
+
+    assert solution_cache._load_solution(("AD9081", "dac", 8, 4)) == {}
+
+
+def test_ad9081_solution_cache_disabled(solution_cache, monkeypatch):
+    monkeypatch.delenv("AD9081_CACHE")
+    key = ("AD9081", "adc", 8, 4)
+    solution_cache._store_solution(key, {"m_vco": 8})
+
+    assert not os.path.exists(solution_cache._SOLUTION_CACHE_FILE)
+    assert solution_cache._load_solution(key) == {}
+
+
+def test_ad9081_get_config_without_solution(solution_cache):
+    from adijif.solvers import CpoModel
+
+    conv = adijif.ad9081_rx(CpoModel(), solver="CPLEX")
+    conv.sample_clock = 250e6
+    conv.decimation = 16
+    conv.get_required_clocks()
+
+    assert conv.get_config() == {"clocking_option": "integrated_pll"}
+    assert not os.path.exists(solution_cache._SOLUTION_CACHE_FILE)
+
+
+def test_ad9081_rxtx_solver_cached(solution_cache):
+    def solve():
+        sys = adijif.system("ad9081", "hmc7044", "xilinx", 1e8, solver="CPLEX")
+        sys.fpga.setup_by_dev_kit_name("zc706")
+        sys.converter.clocking_option = "integrated_pll"
+        for conv in [sys.converter.dac, sys.converter.adc]:
+            conv.clocking_option = "integrated_pll"
+            conv.jesd_class = "jesd204b"
+            conv.sample_clock = 250e6
+            conv.L = 4
+            conv.M = 8
+            conv.N = 16
+            conv.Np = 16
+            conv.K = 32
+            conv.F = 4
+            conv.HD = 0
+        sys.converter.dac.interpolation = 48
+        sys.converter.adc.decimation = 16
+        return sys.solve()
+
+    # First solve stores the dividers, second solve starts from them
+    solve()
+    with open(solution_cache._SOLUTION_CACHE_FILE) as f:
+        (values,) = json.load(f).values()
+    assert set(values) == {
+        "m_vco",
+        "n_vco",
+        "r",
+        "d",
+        "adc_lmfc_divisor_sysref_squared",
+    }
+
+    o = solve()
+    assert o["fpga_AD9081"][0]["type"] == "qpll"
+    assert o["fpga_AD9081"][1]["type"] == "qpll"